@@ -3,11 +3,16 @@
 Test numerical stability of log-domain delta_q_for_stake implementation.
 Tests extreme cases that would cause exponential overflow in the old implementation.
 """
-import requests
+import asyncio
 import json
 
+import aiohttp
+
+# Bound every probe so a slow backend can't hang the test
+REQUEST_TIMEOUT = aiohttp.ClientTimeout(total=5)
+
 # Test with a long-running market that would cause overflow in the old implementation
-def test_extreme_market_values():
+async def test_extreme_market_values():
     print("Testing numerical stability with extreme market values...")
     
     # These values would cause exp(q/b) overflow (q/b > 709) in the old implementation
@@ -46,7 +51,7 @@ def test_extreme_market_values():
         }
     ]
     
-    for test_case in test_cases:
+    async def check_case(test_case):
         print(f"\n{test_case['name']}:")
         print(f"  q_yes/b = {test_case['q_yes']/test_case['b']:.1f}, q_no/b = {test_case['q_no']/test_case['b']:.1f}")
         
@@ -67,14 +72,23 @@ def test_extreme_market_values():
         except Exception as e:
             print(f"  Status: ❌ Error: {e}")
 
-def test_basic_market_operations():
+    # Cases run concurrently so they collapse to one round-trip once they hit the network
+    await asyncio.gather(*(check_case(test_case) for test_case in test_cases))
+
+async def test_basic_market_operations(session):
     """Test basic market operations still work correctly"""
     print("\n\nTesting basic market operations...")
     
     try:
-        # Get an available event
-        response = requests.get("http://localhost:3000/api/events")
-        events = response.json()
+        # Backend events and engine health are independent, so fetch them concurrently
+        async def get_json(url):
+            async with session.get(url) as response:
+                return await response.json()
+
+        events, health = await asyncio.gather(
+            get_json("http://localhost:3000/api/events"),
+            get_json("http://localhost:3001/health"),
+        )
         
         if not events:
             print("No events available for testing")
@@ -85,9 +99,6 @@ def test_basic_market_operations():
         print(f"Testing with event {event_id}: {event['title']}")
         print(f"Current prob: {event['market_prob']}, liquidity: {event['liquidity_b']}")
         
-        # Test health endpoint
-        health_response = requests.get("http://localhost:3001/health")
-        health = health_response.json()
         print(f"Prediction engine health: {health['status']}")
         
         print("✅ Basic operations working correctly")
@@ -95,13 +106,18 @@ def test_basic_market_operations():
     except Exception as e:
         print(f"❌ Error in basic operations: {e}")
 
+async def main():
+    # One session for all probes so connections are kept alive and pooled
+    async with aiohttp.ClientSession(timeout=REQUEST_TIMEOUT) as session:
+        await test_extreme_market_values()
+        await test_basic_market_operations(session)
+
 if __name__ == "__main__":
     print("=== Numerical Stability Test for Log-Domain delta_q_for_stake ===")
     print("This test verifies that the new log-domain implementation can handle")
     print("extreme market values that would cause exponential overflow in the old version.\n")
     
-    test_extreme_market_values()
-    test_basic_market_operations()
+    asyncio.run(main())
     
     print("\n=== Test Summary ===")
     print("✅ Log-domain implementation prevents exp(q/b) overflow")